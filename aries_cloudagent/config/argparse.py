@@ -16,7 +16,7 @@ from configargparse import ArgumentParser, Namespace, YAMLConfigFileParser
 from ..utils.tracing import trace_event
 
 from .error import ArgsParseError
-from .util import BoundedInt, ByteSize
+from .util import BoundedFloat, BoundedInt, ByteSize
 
 from .plugin_settings import PLUGIN_CONFIG_KEY
 
@@ -1051,6 +1051,63 @@ class ProtocolGroup(ArgumentGroup):
             env_var="ACAPY_MONITOR_FORWARD",
             help="Send a webhook when a forward is received.",
         )
+        parser.add_argument(
+            "--oob-connection-timeout",
+            type=BoundedInt(min=1),
+            metavar="<seconds>",
+            env_var="ACAPY_OOB_CONNECTION_TIMEOUT",
+            help=(
+                "Maximum time in seconds to wait for the connection of a received "
+                "out-of-band invitation to become active before processing its "
+                "attachments. Default: 7."
+            ),
+        )
+        parser.add_argument(
+            "--oob-reuse-timeout",
+            type=BoundedInt(min=1),
+            metavar="<seconds>",
+            env_var="ACAPY_OOB_REUSE_TIMEOUT",
+            help=(
+                "Maximum time in seconds to wait for a response to an out-of-band "
+                "handshake reuse message before creating a new connection. "
+                "Default: 15."
+            ),
+        )
+        parser.add_argument(
+            "--oob-reuse-concurrency",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_OOB_REUSE_CONCURRENCY",
+            help=(
+                "Maximum number of received out-of-band handshake reuse messages "
+                "processed concurrently, to avoid exhausting the storage "
+                "connection pool under bursts. Default: no limit."
+            ),
+        )
+        parser.add_argument(
+            "--oob-webhook-batch-size",
+            type=BoundedInt(min=1),
+            metavar="<count>",
+            env_var="ACAPY_OOB_WEBHOOK_BATCH_SIZE",
+            help=(
+                "Batch out-of-band connection reuse webhooks: send up to <count> "
+                "events per topic in a single webhook with payload "
+                '{"events": [...]}. Reuse accepted webhooks are batched per '
+                'invitation, as {"invi_msg_id": ..., "accepts": [...]}. '
+                "Default: batching disabled."
+            ),
+        )
+        parser.add_argument(
+            "--oob-webhook-batch-wait",
+            type=BoundedFloat(min=0.0, max=60.0),
+            metavar="<seconds>",
+            env_var="ACAPY_OOB_WEBHOOK_BATCH_WAIT",
+            help=(
+                "Maximum time in seconds an out-of-band webhook event is held "
+                "for batching, between 0 and 60. Requires --oob-webhook-batch-size. "
+                "Default: 2."
+            ),
+        )
         parser.add_argument(
             "--public-invites",
             action="store_true",
@@ -1159,6 +1216,21 @@ class ProtocolGroup(ArgumentGroup):
             settings["debug.monitor_ping"] = args.monitor_ping
         if args.monitor_forward:
             settings["monitor_forward"] = args.monitor_forward
+        if args.oob_connection_timeout:
+            settings["oob.connection_timeout"] = args.oob_connection_timeout
+        if args.oob_reuse_timeout:
+            settings["oob.reuse_timeout"] = args.oob_reuse_timeout
+        if args.oob_reuse_concurrency:
+            settings["oob.reuse_concurrency"] = args.oob_reuse_concurrency
+        if args.oob_webhook_batch_size:
+            settings["oob.webhook_batch_size"] = args.oob_webhook_batch_size
+        if args.oob_webhook_batch_wait is not None:
+            if not args.oob_webhook_batch_size:
+                raise ArgsParseError(
+                    "--oob-webhook-batch-size is required to use "
+                    "--oob-webhook-batch-wait"
+                )
+            settings["oob.webhook_batch_wait"] = args.oob_webhook_batch_wait
         if args.public_invites:
             settings["public_invites"] = True
         if args.requests_through_public_did:
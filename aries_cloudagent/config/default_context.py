@@ -12,11 +12,13 @@ from ..protocols.actionmenu.v1_0.driver_service import DriverMenuService
 from ..protocols.didcomm_prefix import DIDCommPrefix
 from ..protocols.introduction.v0_1.base_service import BaseIntroductionService
 from ..protocols.introduction.v0_1.demo_service import DemoIntroductionService
+from ..protocols.out_of_band.v1_0.reuse_limiter import ReuseLimiter
 from ..resolver.did_resolver import DIDResolver
 from ..tails.base import BaseTailsServer
 from ..transport.wire_format import BaseWireFormat
 from ..utils.dependencies import is_indy_sdk_module_installed
 from ..utils.stats import Collector
+from ..utils.webhook_batcher import WebhookBatcher
 from ..wallet.did_method import DIDMethods
 from ..wallet.key_type import KeyTypes
 from .base_context import ContextBuilder
@@ -54,6 +56,22 @@ class DefaultContextBuilder(ContextBuilder):
         context.injector.bind_instance(DIDMethods, DIDMethods())
         context.injector.bind_instance(KeyTypes, KeyTypes())
 
+        # Limit on concurrently processed out-of-band reuse messages
+        if context.settings.get("oob.reuse_concurrency"):
+            context.injector.bind_instance(
+                ReuseLimiter, ReuseLimiter(context.settings["oob.reuse_concurrency"])
+            )
+
+        # Batching of out-of-band reuse webhooks
+        if context.settings.get("oob.webhook_batch_size"):
+            context.injector.bind_instance(
+                WebhookBatcher,
+                WebhookBatcher(
+                    max_size=context.settings["oob.webhook_batch_size"],
+                    max_wait=context.settings.get("oob.webhook_batch_wait", 2.0),
+                ),
+            )
+
         await self.bind_providers(context)
         await self.load_plugins(context)
 
@@ -3,7 +3,7 @@ from configargparse import ArgumentTypeError
 from asynctest import TestCase as AsyncTestCase, mock as async_mock
 
 from .. import argparse
-from ..util import BoundedInt, ByteSize
+from ..util import BoundedFloat, BoundedInt, ByteSize
 
 
 class TestArgParse(AsyncTestCase):
@@ -364,6 +364,33 @@ class TestArgParse(AsyncTestCase):
 
         assert repr(bounded) == "integer"
 
+    def test_bounded_float(self):
+        bounded = BoundedFloat()
+        with self.assertRaises(ArgumentTypeError):
+            bounded(None)
+        with self.assertRaises(ArgumentTypeError):
+            bounded("")
+        with self.assertRaises(ArgumentTypeError):
+            bounded("a")
+        with self.assertRaises(ArgumentTypeError):
+            bounded("nan")
+        with self.assertRaises(ArgumentTypeError):
+            bounded("inf")
+        assert bounded("1.5") == 1.5
+        assert bounded("-99") == -99.0
+
+        bounded = BoundedFloat(min=0.0)
+        with self.assertRaises(ArgumentTypeError):
+            bounded("-0.5")
+        assert bounded("0") == 0.0
+
+        bounded = BoundedFloat(max=10.0)
+        with self.assertRaises(ArgumentTypeError):
+            bounded("10.5")
+        assert bounded("10") == 10.0
+
+        assert repr(bounded) == "float"
+
     async def test_mediation_x_clear_and_default(self):
         parser = argparse.create_argument_parser()
         group = argparse.MediationGroup()
@@ -470,6 +497,90 @@ class TestArgParse(AsyncTestCase):
             "disclose_goal_code_list"
         )
 
+    async def test_oob_timeout_args(self):
+        """Test out-of-band timeout argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.ProtocolGroup()
+        group.add_arguments(parser)
+        argparse.TransportGroup().add_arguments(parser)
+
+        result = parser.parse_args(
+            ["--oob-connection-timeout", "10", "--oob-reuse-timeout", "30"]
+        )
+
+        assert result.oob_connection_timeout == 10
+        assert result.oob_reuse_timeout == 30
+
+        settings = group.get_settings(result)
+
+        assert settings.get("oob.connection_timeout") == 10
+        assert settings.get("oob.reuse_timeout") == 30
+
+    async def test_oob_reuse_concurrency_arg(self):
+        """Test out-of-band reuse concurrency argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.ProtocolGroup()
+        group.add_arguments(parser)
+        argparse.TransportGroup().add_arguments(parser)
+
+        result = parser.parse_args(["--oob-reuse-concurrency", "4"])
+        assert result.oob_reuse_concurrency == 4
+
+        settings = group.get_settings(result)
+        assert settings.get("oob.reuse_concurrency") == 4
+
+    async def test_oob_webhook_batch_args(self):
+        """Test out-of-band webhook batching argument parsing."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.ProtocolGroup()
+        group.add_arguments(parser)
+        argparse.TransportGroup().add_arguments(parser)
+
+        result = parser.parse_args([])
+        settings = group.get_settings(result)
+        assert "oob.webhook_batch_size" not in settings
+        assert "oob.webhook_batch_wait" not in settings
+
+        result = parser.parse_args(
+            ["--oob-webhook-batch-size", "20", "--oob-webhook-batch-wait", "0.5"]
+        )
+        assert result.oob_webhook_batch_size == 20
+        assert result.oob_webhook_batch_wait == 0.5
+
+        settings = group.get_settings(result)
+        assert settings.get("oob.webhook_batch_size") == 20
+        assert settings.get("oob.webhook_batch_wait") == 0.5
+
+        result = parser.parse_args(["--oob-webhook-batch-size", "20"])
+        settings = group.get_settings(result)
+        assert settings.get("oob.webhook_batch_size") == 20
+        assert "oob.webhook_batch_wait" not in settings
+
+    async def test_oob_webhook_batch_args_x(self):
+        """Test out-of-band webhook batching argument validation."""
+
+        parser = argparse.create_argument_parser()
+        group = argparse.ProtocolGroup()
+        group.add_arguments(parser)
+
+        result = parser.parse_args(["--oob-webhook-batch-wait", "0.5"])
+        with self.assertRaises(argparse.ArgsParseError):
+            group.get_settings(result)
+
+        for args in (
+            ["--oob-webhook-batch-size", "0"],
+            ["--oob-webhook-batch-wait", "-1"],
+            ["--oob-webhook-batch-wait", "61"],
+            ["--oob-webhook-batch-wait", "nan"],
+        ):
+            with async_mock.patch.object(parser, "exit") as mock_exit:
+                mock_exit.side_effect = SystemExit
+                with self.assertRaises(SystemExit):
+                    parser.parse_args(args)
+
     def test_universal_resolver(self):
         """Test universal resolver flags."""
         parser = argparse.create_argument_parser()
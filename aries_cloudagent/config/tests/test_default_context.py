@@ -5,7 +5,9 @@ from asynctest import TestCase as AsyncTestCase
 from ...cache.base import BaseCache
 from ...core.profile import ProfileManager
 from ...core.protocol_registry import ProtocolRegistry
+from ...protocols.out_of_band.v1_0.reuse_limiter import ReuseLimiter
 from ...transport.wire_format import BaseWireFormat
+from ...utils.webhook_batcher import WebhookBatcher
 
 from ..default_context import DefaultContextBuilder
 from ..injection_context import InjectionContext
@@ -36,3 +38,31 @@ class TestDefaultContext(AsyncTestCase):
         )
         result = await builder.build_context()
         assert isinstance(result, InjectionContext)
+
+    async def test_build_context_oob_reuse_limiter(self):
+        """Test reuse limiter is bound only when configured."""
+
+        result = await DefaultContextBuilder().build_context()
+        assert result.inject_or(ReuseLimiter) is None
+
+        builder = DefaultContextBuilder(settings={"oob.reuse_concurrency": 3})
+        result = await builder.build_context()
+        assert isinstance(result.inject(ReuseLimiter), ReuseLimiter)
+
+    async def test_build_context_oob_webhook_batcher(self):
+        """Test webhook batcher is bound only when configured."""
+
+        result = await DefaultContextBuilder().build_context()
+        assert result.inject_or(WebhookBatcher) is None
+
+        builder = DefaultContextBuilder(settings={"oob.webhook_batch_size": 10})
+        result = await builder.build_context()
+        batcher = result.inject(WebhookBatcher)
+        assert batcher.max_size == 10
+        assert batcher.max_wait == 2.0
+
+        builder = DefaultContextBuilder(
+            settings={"oob.webhook_batch_size": 10, "oob.webhook_batch_wait": 0.5}
+        )
+        result = await builder.build_context()
+        assert result.inject(WebhookBatcher).max_wait == 0.5
@@ -1,5 +1,6 @@
 """Entrypoint."""
 
+import math
 import os
 import re
 
@@ -49,6 +50,39 @@ class BoundedInt:
         return "integer"
 
 
+class BoundedFloat:
+    """Argument value parser for a bounded, finite float."""
+
+    def __init__(self, min: float = None, max: float = None):
+        """Initialize the BoundedFloat parser."""
+        self.min_val = min
+        self.max_val = max
+
+    def __call__(self, arg: str) -> float:
+        """Interpret the argument value."""
+        if not arg:
+            raise ArgumentTypeError("Expected numeric value")
+        try:
+            val = float(arg)
+        except ValueError:
+            raise ArgumentTypeError(f"Invalid numeric value: '{arg}'")
+        if not math.isfinite(val):
+            raise ArgumentTypeError(f"Invalid numeric value: '{arg}'")
+        if self.min_val is not None and val < self.min_val:
+            raise ArgumentTypeError(
+                f"Value must be greater than or equal to {self.min_val}"
+            )
+        if self.max_val is not None and val > self.max_val:
+            raise ArgumentTypeError(
+                f"Value must be less than or equal to {self.max_val}"
+            )
+        return val
+
+    def __repr__(self):
+        """Format for in error reporting."""
+        return "float"
+
+
 class ByteSize:
     """Argument value parser for byte sizes."""
 
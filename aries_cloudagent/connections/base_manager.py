@@ -15,6 +15,7 @@ from pydid import (
 import pydid
 from pydid.verification_method import Ed25519VerificationKey2018
 
+from ..cache.base import BaseCache
 from ..core.error import BaseError
 from ..core.profile import Profile
 from ..did.did_key import DIDKey
@@ -391,6 +392,39 @@ class BaseConnectionManager:
 
         return results
 
+    async def get_connection_targets(
+        self, *, connection_id: str = None, connection: ConnRecord = None
+    ):
+        """Create a connection target from a `ConnRecord`.
+
+        Args:
+            connection_id: The connection ID to search for
+            connection: The connection record itself, if already available
+        """
+        if not connection_id:
+            connection_id = connection.connection_id
+        cache = self._profile.inject_or(BaseCache)
+        cache_key = f"connection_target::{connection_id}"
+        if cache:
+            async with cache.acquire(cache_key) as entry:
+                if entry.result:
+                    targets = [
+                        ConnectionTarget.deserialize(row) for row in entry.result
+                    ]
+                else:
+                    if not connection:
+                        async with self._profile.session() as session:
+                            connection = await ConnRecord.retrieve_by_id(
+                                session, connection_id
+                            )
+
+                    targets = await self.fetch_connection_targets(connection)
+
+                    await entry.set_result([row.serialize() for row in targets], 3600)
+        else:
+            targets = await self.fetch_connection_targets(connection)
+        return targets
+
     def diddoc_connection_targets(
         self, doc: DIDDoc, sender_verkey: str, their_label: str = None
     ) -> Sequence[ConnectionTarget]:
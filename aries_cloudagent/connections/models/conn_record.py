@@ -3,7 +3,7 @@
 import json
 
 from enum import Enum
-from typing import Any, Optional, Union
+from typing import Any, Mapping, Optional, Union
 
 from marshmallow import fields, validate
 
@@ -575,6 +575,39 @@ class ConnRecord(BaseRecord):
             )
             await storage.add_record(record)
 
+    async def metadata_set_all(self, session: ProfileSession, metadata: Mapping):
+        """Set several arbitrary metadata values associated with this connection.
+
+        Existing metadata records are looked up with a single query rather than
+        once per key.
+
+        Args:
+            session (ProfileSession): session used for storage
+            metadata (Mapping): mapping of metadata keys to values to set
+        """
+        assert self.connection_id
+        storage: BaseStorage = session.inject(BaseStorage)
+        existing = {
+            record.tags["key"]: record
+            for record in await storage.find_all_records(
+                self.RECORD_TYPE_METADATA,
+                {"connection_id": self.connection_id},
+            )
+        }
+        for key, value in metadata.items():
+            value = json.dumps(value)
+            record = existing.get(key)
+            if record:
+                await storage.update_record(record, value, record.tags)
+            else:
+                await storage.add_record(
+                    StorageRecord(
+                        self.RECORD_TYPE_METADATA,
+                        value,
+                        {"key": key, "connection_id": self.connection_id},
+                    )
+                )
+
     async def metadata_delete(self, session: ProfileSession, key: str):
         """Delete custom metadata associated with this connection.
 
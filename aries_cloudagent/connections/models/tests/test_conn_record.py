@@ -457,6 +457,18 @@ class TestConnRecord(AsyncTestCase):
         retrieved = await record.metadata_get_all(self.session)
         assert retrieved == {"key": {"test": "updated"}, "other": {"test": "other"}}
 
+    async def test_metadata_set_all(self):
+        record = ConnRecord(
+            my_did=self.test_did,
+        )
+        await record.save(self.session)
+        await record.metadata_set(self.session, "key", {"test": "value"})
+        await record.metadata_set_all(
+            self.session, {"key": {"test": "updated"}, "other": {"test": "other"}}
+        )
+        retrieved = await record.metadata_get_all(self.session)
+        assert retrieved == {"key": {"test": "updated"}, "other": {"test": "other"}}
+
     async def test_metadata_get_all_without_set_is_empty(self):
         record = ConnRecord(
             my_did=self.test_did,
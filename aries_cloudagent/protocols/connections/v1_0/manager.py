@@ -9,7 +9,6 @@ from ....cache.base import BaseCache
 from ....config.base import InjectionError
 from ....connections.base_manager import BaseConnectionManager
 from ....connections.models.conn_record import ConnRecord
-from ....connections.models.connection_target import ConnectionTarget
 from ....core.error import BaseError
 from ....core.profile import Profile
 from ....messaging.responder import BaseResponder
@@ -1059,39 +1058,6 @@ class ConnectionManager(BaseConnectionManager):
             receipt.sender_did, receipt.recipient_did, receipt.recipient_verkey, True
         )
 
-    async def get_connection_targets(
-        self, *, connection_id: str = None, connection: ConnRecord = None
-    ):
-        """Create a connection target from a `ConnRecord`.
-
-        Args:
-            connection_id: The connection ID to search for
-            connection: The connection record itself, if already available
-        """
-        if not connection_id:
-            connection_id = connection.connection_id
-        cache = self.profile.inject_or(BaseCache)
-        cache_key = f"connection_target::{connection_id}"
-        if cache:
-            async with cache.acquire(cache_key) as entry:
-                if entry.result:
-                    targets = [
-                        ConnectionTarget.deserialize(row) for row in entry.result
-                    ]
-                else:
-                    if not connection:
-                        async with self.profile.session() as session:
-                            connection = await ConnRecord.retrieve_by_id(
-                                session, connection_id
-                            )
-
-                    targets = await self.fetch_connection_targets(connection)
-
-                    await entry.set_result([row.serialize() for row in targets], 3600)
-        else:
-            targets = await self.fetch_connection_targets(connection)
-        return targets
-
     async def establish_inbound(
         self,
         connection: ConnRecord,
@@ -25,7 +25,7 @@ class HandshakeReuseMessageHandler(BaseHandler):
         assert isinstance(context.message, HandshakeReuse)
 
         profile = context.profile
-        mgr = OutOfBandManager(profile)
+        mgr = OutOfBandManager(profile, responder)
         try:
             await mgr.receive_reuse_message(
                 context.message, context.message_receipt, context.connection_record
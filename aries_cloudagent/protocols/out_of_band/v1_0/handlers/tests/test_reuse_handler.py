@@ -41,6 +41,7 @@ class TestHandshakeReuseHandler:
         request_context.connection_record = ConnRecord()
         responder = MockResponder()
         await handler.handle(request_context, responder)
+        mock_oob_mgr.assert_called_once_with(request_context.profile, responder)
         mock_oob_mgr.return_value.receive_reuse_message.assert_called_once_with(
             request_context.message,
             request_context.message_receipt,
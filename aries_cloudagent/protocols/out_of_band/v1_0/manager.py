@@ -3,7 +3,8 @@
 import asyncio
 import logging
 import re
-from typing import Mapping, Optional, Sequence, Union, Text
+from functools import lru_cache
+from typing import Mapping, Optional, Sequence, Tuple, Union, Text
 import uuid
 
 
@@ -14,11 +15,12 @@ from ....connections.base_manager import BaseConnectionManager
 from ....connections.models.conn_record import ConnRecord
 from ....core.error import BaseError
 from ....core.oob_processor import OobMessageProcessor
-from ....core.profile import Profile
+from ....core.profile import Profile, ProfileSession
 from ....did.did_key import DIDKey
 from ....messaging.responder import BaseResponder
 from ....storage.error import StorageNotFoundError
 from ....transport.inbound.receipt import MessageReceipt
+from ....utils.webhook_batcher import WebhookBatcher
 from ....wallet.base import BaseWallet
 from ....wallet.key_type import ED25519
 from ...connections.v1_0.manager import ConnectionManager
@@ -36,12 +38,50 @@ from .messages.reuse_accept import HandshakeReuseAccept
 from .messages.service import Service as ServiceMessage
 from .models.invitation import InvitationRecord
 from .models.oob_record import OobRecord
+from .reuse_limiter import ReuseLimiter
 from .messages.service import Service
 from .message_types import DEFAULT_VERSION
 
 LOGGER = logging.getLogger(__name__)
 REUSE_WEBHOOK_TOPIC = "acapy::webhook::connection_reuse"
 REUSE_ACCEPTED_WEBHOOK_TOPIC = "acapy::webhook::connection_reuse_accepted"
+OOB_REUSE_RESPONSE_STATE = re.compile(
+    "^acapy::record::out_of_band::(reuse-accepted|reuse-not-accepted)$"
+)
+CONNECTION_READY_EVENT = re.compile(
+    "^acapy::record::connections::(active|completed|response)$"
+)
+
+# Exchange record class and the attribute holding the attached message,
+# by attachment type and protocol version
+ATTACHMENT_RECORDS = {
+    "credential-offer": {
+        "1.0": (V10CredentialExchange, "credential_offer_dict"),
+        "2.0": (V20CredExRecord, "cred_offer"),
+    },
+    "present-proof": {
+        "1.0": (V10PresentationExchange, "presentation_request_dict"),
+        "2.0": (V20PresExRecord, "pres_request"),
+    },
+}
+
+
+_unqualify = lru_cache(maxsize=256)(DIDCommPrefix.unqualify)
+
+# Handshake protocols by unqualified message family name, as used in invitations
+HSPROTO_BY_NAME = {hsp.name: hsp for hsp in HSProto}
+
+
+@lru_cache(maxsize=1024)
+def _did_key_ed25519(verkey: str) -> str:
+    """Convert an ed25519 verkey to a did:key, memoized."""
+    return DIDKey.from_public_key_b58(verkey, ED25519).did
+
+
+@lru_cache(maxsize=4096)
+def _did_key_to_b58(did_key: str) -> str:
+    """Convert a did:key to its base58 public key, memoized."""
+    return DIDKey.from_did(did_key).public_key_b58
 
 
 class OutOfBandManagerError(BaseError):
@@ -55,14 +95,23 @@ class OutOfBandManagerNotImplementedError(BaseError):
 class OutOfBandManager(BaseConnectionManager):
     """Class for managing out of band messages."""
 
-    def __init__(self, profile: Profile):
+    # Receiver method name by handshake protocol
+    _handshake_receivers = {
+        HSProto.RFC23: "_receive_didexchange_invitation",
+        HSProto.RFC160: "_receive_connection_invitation",
+    }
+
+    def __init__(self, profile: Profile, responder: BaseResponder = None):
         """
         Initialize a OutOfBandManager.
 
         Args:
             profile: The profile for this out of band manager
+            responder: The responder to use; injected on first use if omitted
         """
         self._profile = profile
+        self._responder = responder
+        self._oob_processor = None
         super().__init__(self._profile)
 
     @property
@@ -76,6 +125,48 @@ class OutOfBandManager(BaseConnectionManager):
         """
         return self._profile
 
+    @property
+    def responder(self) -> BaseResponder:
+        """Accessor for the responder, injected on first use."""
+        if self._responder is None:
+            self._responder = self._profile.inject(BaseResponder)
+        return self._responder
+
+    @property
+    def oob_processor(self) -> OobMessageProcessor:
+        """Accessor for the oob message processor, injected on first use."""
+        if self._oob_processor is None:
+            self._oob_processor = self._profile.inject(OobMessageProcessor)
+        return self._oob_processor
+
+    async def _notify_webhook(
+        self, topic: str, payload: dict, group: Mapping = None, field: str = "events"
+    ):
+        """Emit a webhook event, batched if a webhook batcher is configured.
+
+        Args:
+            topic: The webhook event topic
+            payload: The webhook payload
+            group: Items to batch the payload by, included in the batch payload
+            field: Name of the batch payload field listing the payloads
+        """
+        batcher = self._profile.inject_or(WebhookBatcher)
+        if batcher:
+            await batcher.enqueue(
+                self._profile, topic, payload, group=group, field=field
+            )
+        else:
+            await self._profile.notify(topic, payload)
+
+    async def _notify_reuse_accepted(self, invi_msg_id: str, payload: dict):
+        """Emit a reuse accepted webhook, batched per invitation if configured."""
+        await self._notify_webhook(
+            REUSE_ACCEPTED_WEBHOOK_TOPIC,
+            payload,
+            group={"invi_msg_id": invi_msg_id},
+            field="accepts",
+        )
+
     async def create_invitation(
         self,
         my_label: str = None,
@@ -107,7 +198,8 @@ class OutOfBandManager(BaseConnectionManager):
             hs_protos: list of handshake protocols to include
             multi_use: set to True to create an invitation for multiple-use connection
             alias: optional alias to apply to connection for later use
-            attachments: list of dicts in form of {"id": ..., "type": ...}
+            attachments: list of dicts in form of {"id": ..., "type": ...}, with
+                optional "version" ("1.0" or "2.0") of the attached protocol
             service_accept: Optional list of mime types in the order of preference of
             the sender that the receiver can use in responding to the message
             protocol_version: OOB protocol version [1.0, 1.1]
@@ -116,11 +208,6 @@ class OutOfBandManager(BaseConnectionManager):
             Invitation record
 
         """
-        mediation_record = await self._route_manager.mediation_record_if_id(
-            self.profile,
-            mediation_id,
-            or_default=True,
-        )
         image_url = self.profile.context.settings.get("image_url")
 
         if not (hs_protos or attachments):
@@ -148,53 +235,30 @@ class OutOfBandManager(BaseConnectionManager):
 
         invitation_message_id = str(uuid.uuid4())
 
-        message_attachments = []
-        for atch in attachments or []:
-            a_type = atch.get("type")
-            a_id = atch.get("id")
-
-            message = None
+        if public and not self.profile.settings.get("public_invites"):
+            raise OutOfBandManagerError("Public invitations are not enabled")
 
-            if a_type == "credential-offer":
-                try:
-                    async with self.profile.session() as session:
-                        cred_ex_rec = await V10CredentialExchange.retrieve_by_id(
-                            session,
-                            a_id,
-                        )
-                        message = cred_ex_rec.credential_offer_dict.serialize()
+        # Resolve mediation before opening the session; it uses its own session
+        mediation_record = await self._route_manager.mediation_record_if_id(
+            self.profile,
+            mediation_id,
+            or_default=True,
+        )
 
-                except StorageNotFoundError:
-                    async with self.profile.session() as session:
-                        cred_ex_rec = await V20CredExRecord.retrieve_by_id(
-                            session,
-                            a_id,
-                        )
-                        message = cred_ex_rec.cred_offer.serialize()
-            elif a_type == "present-proof":
-                try:
-                    async with self.profile.session() as session:
-                        pres_ex_rec = await V10PresentationExchange.retrieve_by_id(
-                            session,
-                            a_id,
-                        )
-                        message = pres_ex_rec.presentation_request_dict.serialize()
-                except StorageNotFoundError:
-                    async with self.profile.session() as session:
-                        pres_ex_rec = await V20PresExRecord.retrieve_by_id(
-                            session,
-                            a_id,
-                        )
-                        message = pres_ex_rec.pres_request.serialize()
+        # Read phase: load attachments and wallet keys in a single session
+        message_attachments = []
+        async with self.profile.session() as session:
+            for atch in attachments or []:
+                message = await self._load_attachment(session, atch)
+                # Assign pthid to the attached message
+                message.setdefault("~thread", {})["pthid"] = invitation_message_id
+                message_attachments.append(InvitationMessage.wrap_message(message))
+
+            wallet = session.inject(BaseWallet)
+            if public:
+                public_did = await wallet.get_public_did()
             else:
-                raise OutOfBandManagerError(f"Unknown attachment type: {a_type}")
-
-            # Assign pthid to the attached message
-            message["~thread"] = {
-                **message.get("~thread", {}),
-                "pthid": invitation_message_id,
-            }
-            message_attachments.append(InvitationMessage.wrap_message(message))
+                connection_key = await wallet.create_signing_key(ED25519)
 
         handshake_protocols = [
             DIDCommPrefix.qualify_current(hsp.name) for hsp in hs_protos or []
@@ -208,13 +272,6 @@ class OutOfBandManager(BaseConnectionManager):
         conn_rec = None
 
         if public:
-            if not self.profile.settings.get("public_invites"):
-                raise OutOfBandManagerError("Public invitations are not enabled")
-
-            async with self.profile.session() as session:
-                wallet = session.inject(BaseWallet)
-                public_did = await wallet.get_public_did()
-
             if not public_did:
                 raise OutOfBandManagerError(
                     "Cannot create public invitation with no public DID"
@@ -255,16 +312,6 @@ class OutOfBandManager(BaseConnectionManager):
                     alias=alias,
                     connection_protocol=connection_protocol,
                 )
-
-                async with self.profile.session() as session:
-                    await conn_rec.save(session, reason="Created new invitation")
-                    await conn_rec.attach_invitation(session, invi_msg)
-
-                    await conn_rec.attach_invitation(session, invi_msg)
-
-                    if metadata:
-                        for key, value in metadata.items():
-                            await conn_rec.metadata_set(session, key, value)
             else:
                 our_service = ServiceDecorator(
                     recipient_keys=[our_recipient_key],
@@ -276,11 +323,6 @@ class OutOfBandManager(BaseConnectionManager):
             if not my_endpoint:
                 my_endpoint = self.profile.settings.get("default_endpoint")
 
-            # Create and store new key for exchange
-            async with self.profile.session() as session:
-                wallet = session.inject(BaseWallet)
-                connection_key = await wallet.create_signing_key(ED25519)
-
             our_recipient_key = connection_key.verkey
 
             # Initializing  InvitationMessage here to include
@@ -309,9 +351,6 @@ class OutOfBandManager(BaseConnectionManager):
                     invitation_msg_id=invi_msg._id,
                 )
 
-                async with self.profile.session() as session:
-                    await conn_rec.save(session, reason="Created new connection")
-
             routing_keys, my_endpoint = await self._route_manager.routing_info(
                 self.profile, my_endpoint, mediation_record
             )
@@ -323,12 +362,12 @@ class OutOfBandManager(BaseConnectionManager):
                     routing_keys=routing_keys,
                 ).serialize()
 
-            routing_keys = [
-                key
-                if len(key.split(":")) == 3
-                else DIDKey.from_public_key_b58(key, ED25519).did
-                for key in routing_keys
-            ]
+            # Convert raw verkeys to did:key, usually all keys are already DIDs
+            if any(key.count(":") != 2 for key in routing_keys):
+                routing_keys = [
+                    key if key.count(":") == 2 else _did_key_ed25519(key)
+                    for key in routing_keys
+                ]
 
             # Create connection invitation message
             # Note: Need to split this into two stages to support inbound routing
@@ -343,37 +382,34 @@ class OutOfBandManager(BaseConnectionManager):
                 ServiceMessage(
                     _id="#inline",
                     _type="did-communication",
-                    recipient_keys=[
-                        DIDKey.from_public_key_b58(connection_key.verkey, ED25519).did
-                    ],
+                    recipient_keys=[_did_key_ed25519(connection_key.verkey)],
                     service_endpoint=my_endpoint,
                     routing_keys=routing_keys,
                 )
             ]
             invi_url = invi_msg.to_url()
 
-            # Update connection record
+        # Write phase: store connection and oob records in a single transaction
+        async with self.profile.transaction() as txn:
             if conn_rec:
-                async with self.profile.session() as session:
-                    await conn_rec.attach_invitation(session, invi_msg)
-
-                    if metadata:
-                        for key, value in metadata.items():
-                            await conn_rec.metadata_set(session, key, value)
-
-        oob_record = OobRecord(
-            role=OobRecord.ROLE_SENDER,
-            state=OobRecord.STATE_AWAIT_RESPONSE,
-            connection_id=conn_rec.connection_id if conn_rec else None,
-            invi_msg_id=invi_msg._id,
-            invitation=invi_msg,
-            our_recipient_key=our_recipient_key,
-            our_service=our_service,
-            multi_use=multi_use,
-        )
-
-        async with self.profile.session() as session:
-            await oob_record.save(session, reason="Created new oob invitation")
+                await conn_rec.save(txn, reason="Created new invitation")
+                await conn_rec.attach_invitation(txn, invi_msg)
+
+                if metadata:
+                    await conn_rec.metadata_set_all(txn, metadata)
+
+            oob_record = OobRecord(
+                role=OobRecord.ROLE_SENDER,
+                state=OobRecord.STATE_AWAIT_RESPONSE,
+                connection_id=conn_rec.connection_id if conn_rec else None,
+                invi_msg_id=invi_msg._id,
+                invitation=invi_msg,
+                our_recipient_key=our_recipient_key,
+                our_service=our_service,
+                multi_use=multi_use,
+            )
+            await oob_record.save(txn, reason="Created new oob invitation")
+            await txn.commit()
 
         if conn_rec:
             await self._route_manager.route_invitation(
@@ -388,6 +424,37 @@ class OutOfBandManager(BaseConnectionManager):
             invitation_url=invi_url,
         )
 
+    async def _load_attachment(self, session: ProfileSession, atch: Mapping) -> dict:
+        """Load the serialized message for an invitation attachment."""
+        a_type = atch.get("type")
+        a_id = atch.get("id")
+        a_version = atch.get("version")
+
+        records = ATTACHMENT_RECORDS.get(a_type)
+        if not records:
+            raise OutOfBandManagerError(f"Unknown attachment type: {a_type}")
+
+        if a_version:
+            if a_version not in records:
+                raise OutOfBandManagerError(
+                    f"Unknown attachment version for {a_type}: {a_version}"
+                )
+            candidates = [records[a_version]]
+        else:
+            # No version given: probe each protocol version in turn
+            candidates = list(records.values())
+
+        *fallbacks, (record_cls, message_attr) = candidates
+        for fallback_cls, fallback_attr in fallbacks:
+            try:
+                ex_rec = await fallback_cls.retrieve_by_id(session, a_id)
+                return getattr(ex_rec, fallback_attr).serialize()
+            except StorageNotFoundError:
+                pass
+
+        ex_rec = await record_cls.retrieve_by_id(session, a_id)
+        return getattr(ex_rec, message_attr).serialize()
+
     async def receive_invitation(
         self,
         invitation: InvitationMessage,
@@ -482,7 +549,7 @@ class OutOfBandManager(BaseConnectionManager):
         # Try to create a connection. Either if the reuse failed or we didn't have a
         # connection yet. Throws an error if connection could not be created
         if not conn_rec and invitation.handshake_protocols:
-            oob_record = await self._perform_handshake(
+            oob_record, conn_rec = await self._perform_handshake(
                 oob_record=oob_record,
                 alias=alias,
                 auto_accept=auto_accept,
@@ -492,11 +559,6 @@ class OutOfBandManager(BaseConnectionManager):
             LOGGER.debug(
                 f"Performed handshake with connection {oob_record.connection_id}"
             )
-            # re-fetch connection record
-            async with self.profile.session() as session:
-                conn_rec = await ConnRecord.retrieve_by_id(
-                    session, oob_record.connection_id
-                )
 
         # If a connection record is associated with the oob record we can remove it now as
         # we can leverage the connection for all exchanges. Otherwise we need to keep it
@@ -552,7 +614,7 @@ class OutOfBandManager(BaseConnectionManager):
     async def _process_request_attach(self, oob_record: OobRecord):
         invitation = oob_record.invitation
 
-        message_processor = self.profile.inject(OobMessageProcessor)
+        message_processor = self.oob_processor
         messages = [attachment.content for attachment in invitation.requests_attach]
 
         their_service = None
@@ -583,12 +645,10 @@ class OutOfBandManager(BaseConnectionManager):
         else:
             # Create ~service decorator from the oob service
             recipient_keys = [
-                DIDKey.from_did(did_key).public_key_b58
-                for did_key in service.recipient_keys
+                _did_key_to_b58(did_key) for did_key in service.recipient_keys
             ]
             routing_keys = [
-                DIDKey.from_did(did_key).public_key_b58
-                for did_key in service.routing_keys
+                _did_key_to_b58(did_key) for did_key in service.routing_keys
             ]
 
             return ServiceDecorator(
@@ -598,7 +658,7 @@ class OutOfBandManager(BaseConnectionManager):
             )
 
     async def _wait_for_reuse_response(
-        self, oob_id: str, timeout: int = 15
+        self, oob_id: str, timeout: int = None
     ) -> OobRecord:
         """Wait for reuse response.
 
@@ -608,14 +668,14 @@ class OutOfBandManager(BaseConnectionManager):
 
         Args:
             oob_id: Identifier of the oob record
-            timeout: The timeout in seconds to wait for the reuse state [default=15]
+            timeout: The timeout in seconds to wait for the reuse state
+                [default: oob.reuse_timeout setting or 15]
 
         Returns:
 
         """
-        OOB_REUSE_RESPONSE_STATE = re.compile(
-            "^acapy::record::out_of_band::(reuse-accepted|reuse-not-accepted)$"
-        )
+        if timeout is None:
+            timeout = self.profile.settings.get("oob.reuse_timeout", 15)
 
         async def _wait_for_state() -> OobRecord:
             event = self.profile.inject(EventBus)
@@ -654,11 +714,10 @@ class OutOfBandManager(BaseConnectionManager):
                 return oob_record
 
     async def _wait_for_conn_rec_active(
-        self, connection_id: str, timeout: int = 7
+        self, connection_id: str, timeout: int = None
     ) -> Optional[ConnRecord]:
-        CONNECTION_READY_EVENT = re.compile(
-            "^acapy::record::connections::(active|completed|response)$"
-        )
+        if timeout is None:
+            timeout = self.profile.settings.get("oob.connection_timeout", 7)
 
         LOGGER.debug(f"Wait for connection {connection_id} to become active")
 
@@ -716,8 +775,8 @@ class OutOfBandManager(BaseConnectionManager):
 
             # OOB_TODO: replace webhook event with new oob webhook event
             # Emit webhook if the reuse was not accepted
-            await self.profile.notify(
-                REUSE_ACCEPTED_WEBHOOK_TOPIC,
+            await self._notify_reuse_accepted(
+                oob_record.invi_msg_id,
                 {
                     "thread_id": oob_record.reuse_msg_id,
                     "connection_id": conn_record.connection_id,
@@ -743,18 +802,18 @@ class OutOfBandManager(BaseConnectionManager):
         auto_accept: Optional[bool] = None,
         mediation_id: Optional[str] = None,
         service_accept: Optional[Sequence[Text]] = None,
-    ) -> OobRecord:
+    ) -> Tuple[OobRecord, ConnRecord]:
         invitation = oob_record.invitation
 
-        supported_handshake_protocols = [
-            HSProto.get(hsp)
-            for hsp in dict.fromkeys(
-                [
-                    DIDCommPrefix.unqualify(proto)
-                    for proto in invitation.handshake_protocols
-                ]
-            )
-        ]
+        seen = set()
+        supported_handshake_protocols = []
+        for proto in invitation.handshake_protocols:
+            hsp = _unqualify(proto)
+            if hsp not in seen:
+                seen.add(hsp)
+                supported_handshake_protocols.append(
+                    HSPROTO_BY_NAME.get(hsp) or HSProto.get(hsp)
+                )
 
         # Get the single service item
         service = invitation.services[0]
@@ -777,61 +836,28 @@ class OutOfBandManager(BaseConnectionManager):
                 {
                     "id": "#inline",
                     "type": "did-communication",
-                    "recipientKeys": [
-                        DIDKey.from_public_key_b58(key, ED25519).did
-                        for key in recipient_keys
-                    ],
-                    "routingKeys": [
-                        DIDKey.from_public_key_b58(key, ED25519).did
-                        for key in routing_keys
-                    ],
+                    "recipientKeys": [_did_key_ed25519(key) for key in recipient_keys],
+                    "routingKeys": [_did_key_ed25519(key) for key in routing_keys],
                     "serviceEndpoint": endpoint,
                 }
             )
 
         LOGGER.debug(f"Creating connection with public did {public_did}")
 
+        protocol = next(
+            (
+                p
+                for p in supported_handshake_protocols
+                if p in self._handshake_receivers
+            ),
+            None,
+        )
         conn_record = None
-        for protocol in supported_handshake_protocols:
-            # DIDExchange
-            if protocol is HSProto.RFC23:
-                didx_mgr = DIDXManager(self.profile)
-                conn_record = await didx_mgr.receive_invitation(
-                    invitation=invitation,
-                    their_public_did=public_did,
-                    auto_accept=auto_accept,
-                    alias=alias,
-                    mediation_id=mediation_id,
-                )
-                break
-            # 0160 Connection
-            elif protocol is HSProto.RFC160:
-                service.recipient_keys = [
-                    DIDKey.from_did(key).public_key_b58
-                    for key in service.recipient_keys or []
-                ]
-                service.routing_keys = [
-                    DIDKey.from_did(key).public_key_b58 for key in service.routing_keys
-                ] or []
-                connection_invitation = ConnectionInvitation.deserialize(
-                    {
-                        "@id": invitation._id,
-                        "@type": DIDCommPrefix.qualify_current(protocol.name),
-                        "label": invitation.label,
-                        "recipientKeys": service.recipient_keys,
-                        "serviceEndpoint": service.service_endpoint,
-                        "routingKeys": service.routing_keys,
-                    }
-                )
-                conn_mgr = ConnectionManager(self.profile)
-                conn_record = await conn_mgr.receive_invitation(
-                    invitation=connection_invitation,
-                    their_public_did=public_did,
-                    auto_accept=auto_accept,
-                    alias=alias,
-                    mediation_id=mediation_id,
-                )
-                break
+        if protocol:
+            receive = getattr(self, self._handshake_receivers[protocol])
+            conn_record = await receive(
+                invitation, service, public_did, auto_accept, alias, mediation_id
+            )
 
         if not conn_record:
             raise OutOfBandManagerError(
@@ -843,7 +869,59 @@ class OutOfBandManager(BaseConnectionManager):
             oob_record.connection_id = conn_record.connection_id
             await oob_record.save(session)
 
-        return oob_record
+        return oob_record, conn_record
+
+    async def _receive_didexchange_invitation(
+        self,
+        invitation: InvitationMessage,
+        service: ServiceMessage,
+        public_did: Optional[str],
+        auto_accept: Optional[bool],
+        alias: Optional[str],
+        mediation_id: Optional[str],
+    ) -> ConnRecord:
+        """Receive an invitation using the DID Exchange (RFC 0023) handshake."""
+        didx_mgr = DIDXManager(self.profile)
+        return await didx_mgr.receive_invitation(
+            invitation=invitation,
+            their_public_did=public_did,
+            auto_accept=auto_accept,
+            alias=alias,
+            mediation_id=mediation_id,
+        )
+
+    async def _receive_connection_invitation(
+        self,
+        invitation: InvitationMessage,
+        service: ServiceMessage,
+        public_did: Optional[str],
+        auto_accept: Optional[bool],
+        alias: Optional[str],
+        mediation_id: Optional[str],
+    ) -> ConnRecord:
+        """Receive an invitation using the Connections (RFC 0160) handshake."""
+        # Service always holds its own key lists, so convert them in place
+        for keys in (service.recipient_keys, service.routing_keys):
+            for index, key in enumerate(keys):
+                keys[index] = _did_key_to_b58(key)
+        connection_invitation = ConnectionInvitation.deserialize(
+            {
+                "@id": invitation._id,
+                "@type": DIDCommPrefix.qualify_current(HSProto.RFC160.name),
+                "label": invitation.label,
+                "recipientKeys": service.recipient_keys,
+                "serviceEndpoint": service.service_endpoint,
+                "routingKeys": service.routing_keys,
+            }
+        )
+        conn_mgr = ConnectionManager(self.profile)
+        return await conn_mgr.receive_invitation(
+            invitation=connection_invitation,
+            their_public_did=public_did,
+            auto_accept=auto_accept,
+            alias=alias,
+            mediation_id=mediation_id,
+        )
 
     async def _create_handshake_reuse_message(
         self,
@@ -865,47 +943,103 @@ class OutOfBandManager(BaseConnectionManager):
             sending the OOB invitation
 
         """
+
+        async def save_oob_record():
+            async with self.profile.session() as session:
+                await oob_record.save(session, reason="Storing reuse msg data")
+
+        saved = False
         try:
             reuse_msg = HandshakeReuse(version=version)
             reuse_msg.assign_thread_id(thid=reuse_msg._id, pthid=oob_record.invi_msg_id)
-
-            connection_targets = await self.fetch_connection_targets(
-                connection=conn_record
+            oob_record.reuse_msg_id = reuse_msg._id
+            oob_record.state = OobRecord.STATE_AWAIT_RESPONSE
+
+            # Store the reuse state before sending, so a fast reply finds it,
+            # while resolving the connection targets; wait for both to settle
+            # so a failed lookup does not race the save
+            results = await asyncio.gather(
+                self.get_connection_targets(connection=conn_record),
+                save_oob_record(),
+                return_exceptions=True,
             )
+            saved = not isinstance(results[1], BaseException)
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            connection_targets = results[0]
 
-            responder = self.profile.inject(BaseResponder)
-            await responder.send(
+            await self.responder.send(
                 message=reuse_msg,
                 target_list=connection_targets,
             )
 
-            async with self.profile.session() as session:
-                oob_record.reuse_msg_id = reuse_msg._id
-                oob_record.state = OobRecord.STATE_AWAIT_RESPONSE
-                await oob_record.save(session, reason="Storing reuse msg data")
-
             return oob_record
 
         except Exception as err:
+            # Don't leave a record awaiting a reuse response that was never sent
+            if saved:
+                try:
+                    async with self.profile.session() as session:
+                        await oob_record.delete_record(session)
+                except Exception:
+                    LOGGER.exception(
+                        "Error deleting oob record %s after failed reuse",
+                        oob_record.oob_id,
+                    )
             raise OutOfBandManagerError(
                 f"Error on creating and sending a handshake reuse message: {err}"
             )
 
-    async def delete_stale_connection_by_invitation(self, invi_msg_id: str):
-        """Delete unused connections, using existing an active connection instead."""
+    async def delete_stale_connection_by_invitation(
+        self,
+        invi_msg_id: str,
+        session: ProfileSession = None,
+        connection_id: str = None,
+    ):
+        """Delete unused connections, using existing an active connection instead.
+
+        Args:
+            invi_msg_id: The invitation message id of the stale connections
+            session: An open session to run in; a new one is opened if omitted
+            connection_id: The connection created with the invitation, if known;
+                it is looked up directly instead of querying by invitation
+        """
+        if not session:
+            async with self.profile.session() as session:
+                await self.delete_stale_connection_by_invitation(
+                    invi_msg_id, session, connection_id
+                )
+            return
+
         tag_filter = {
             "invitation_msg_id": invi_msg_id,
         }
-        post_filter = {"invitation_mode": "once", "state": "invitation"}
+        post_filter = {
+            "invitation_mode": ConnRecord.INVITATION_MODE_ONCE,
+            "state": ConnRecord.State.INVITATION.rfc160,
+        }
 
-        async with self.profile.session() as session:
+        if connection_id:
+            try:
+                conn_rec = await ConnRecord.retrieve_by_id(session, connection_id)
+            except StorageNotFoundError:
+                return
+            conn_records = []
+            if all(
+                getattr(conn_rec, key) == val
+                for key, val in {**tag_filter, **post_filter}.items()
+            ):
+                conn_records.append(conn_rec)
+        else:
             conn_records = await ConnRecord.query(
                 session,
                 tag_filter=tag_filter,
                 post_filter_positive=post_filter,
             )
-            for conn_rec in conn_records:
-                await conn_rec.delete_record(session)
+
+        for conn_rec in conn_records:
+            await conn_rec.delete_record(session)
 
     async def receive_reuse_message(
         self,
@@ -930,6 +1064,15 @@ class OutOfBandManager(BaseConnectionManager):
             or the connection does not exists
 
         """
+        limiter = self._profile.inject_or(ReuseLimiter)
+        if not limiter:
+            return await self._receive_reuse_message(reuse_msg, conn_rec)
+        async with limiter:
+            return await self._receive_reuse_message(reuse_msg, conn_rec)
+
+    async def _receive_reuse_message(
+        self, reuse_msg: HandshakeReuse, conn_rec: ConnRecord
+    ) -> None:
         invi_msg_id = reuse_msg._thread.pthid
         reuse_msg_id = reuse_msg._thread_id
 
@@ -937,37 +1080,52 @@ class OutOfBandManager(BaseConnectionManager):
             version=get_version_from_message(reuse_msg)
         )
         reuse_accept_msg.assign_thread_id(thid=reuse_msg_id, pthid=invi_msg_id)
-        connection_targets = await self.fetch_connection_targets(connection=conn_rec)
-
-        responder = self.profile.inject(BaseResponder)
+        connection_targets = await self.get_connection_targets(connection=conn_rec)
 
         # Update ConnRecord's invi_msg_id
-        async with self._profile.session() as session:
+        async with self._profile.transaction() as txn:
             oob_record = await OobRecord.retrieve_by_tag_filter(
-                session,
+                txn,
                 {"invi_msg_id": invi_msg_id},
                 {"state": OobRecord.STATE_AWAIT_RESPONSE},
             )
 
+            # Only a single-use invitation that created its own connection
+            # record can leave a stale connection behind
+            stale_conn_id = None if oob_record.multi_use else oob_record.connection_id
+
             oob_record.state = OobRecord.STATE_DONE
             oob_record.reuse_msg_id = reuse_msg_id
             oob_record.connection_id = conn_rec.connection_id
 
             # We don't want to store this state. We either remove the record
             # (no multi-use) or we can't update the record (multi-use)
-            await oob_record.emit_event(session)
+            await oob_record.emit_event(txn)
 
             # If the oob_record is not multi-use we can now remove it
             if not oob_record.multi_use:
-                await oob_record.delete_record(session)
+                await oob_record.delete_record(txn)
 
-            conn_rec.invitation_msg_id = invi_msg_id
-            await conn_rec.save(session, reason="Assigning new invitation_msg_id")
+            # Repeated reuse of the same invitation needs no connection update
+            if conn_rec.invitation_msg_id != invi_msg_id:
+                conn_rec.invitation_msg_id = invi_msg_id
+                await conn_rec.save(txn, reason="Assigning new invitation_msg_id")
+
+            # Delete the ConnRecord created; re-use existing connection
+            if stale_conn_id:
+                await self.delete_stale_connection_by_invitation(
+                    invi_msg_id, txn, connection_id=stale_conn_id
+                )
+            await txn.commit()
+
+        # Answer the invitee first; the webhook does not depend on the send
+        await self.responder.send(
+            message=reuse_accept_msg,
+            target_list=connection_targets,
+        )
 
-        # Delete the ConnRecord created; re-use existing connection
-        await self.delete_stale_connection_by_invitation(invi_msg_id)
         # Emit webhook
-        await self.profile.notify(
+        await self._notify_webhook(
             REUSE_WEBHOOK_TOPIC,
             {
                 "thread_id": reuse_msg_id,
@@ -979,11 +1137,6 @@ class OutOfBandManager(BaseConnectionManager):
             },
         )
 
-        await responder.send(
-            message=reuse_accept_msg,
-            target_list=connection_targets,
-        )
-
     async def receive_reuse_accepted_message(
         self,
         reuse_accepted_msg: HandshakeReuseAccept,
@@ -1011,9 +1164,9 @@ class OutOfBandManager(BaseConnectionManager):
         thread_reuse_msg_id = reuse_accepted_msg._thread.thid
 
         try:
-            async with self.profile.session() as session:
+            async with self.profile.transaction() as txn:
                 oob_record = await OobRecord.retrieve_by_tag_filter(
-                    session,
+                    txn,
                     {"invi_msg_id": invi_msg_id, "reuse_msg_id": thread_reuse_msg_id},
                 )
 
@@ -1021,16 +1174,18 @@ class OutOfBandManager(BaseConnectionManager):
                 oob_record.connection_id = conn_record.connection_id
 
                 # We can now remove the oob_record
-                await oob_record.emit_event(session)
-                await oob_record.delete_record(session)
+                await oob_record.emit_event(txn)
+                await oob_record.delete_record(txn)
 
-                conn_record.invitation_msg_id = invi_msg_id
-                await conn_record.save(
-                    session, reason="Assigning new invitation_msg_id"
-                )
+                if conn_record.invitation_msg_id != invi_msg_id:
+                    conn_record.invitation_msg_id = invi_msg_id
+                    await conn_record.save(
+                        txn, reason="Assigning new invitation_msg_id"
+                    )
+                await txn.commit()
             # Emit webhook
-            await self.profile.notify(
-                REUSE_ACCEPTED_WEBHOOK_TOPIC,
+            await self._notify_reuse_accepted(
+                invi_msg_id,
                 {
                     "thread_id": thread_reuse_msg_id,
                     "connection_id": conn_record.connection_id,
@@ -1043,8 +1198,8 @@ class OutOfBandManager(BaseConnectionManager):
             )
         except Exception as e:
             # Emit webhook
-            await self.profile.notify(
-                REUSE_ACCEPTED_WEBHOOK_TOPIC,
+            await self._notify_reuse_accepted(
+                invi_msg_id,
                 {
                     "thread_id": thread_reuse_msg_id,
                     "connection_id": conn_record.connection_id,
@@ -1057,11 +1212,9 @@ class OutOfBandManager(BaseConnectionManager):
                 },
             )
             raise OutOfBandManagerError(
-                (
-                    "Error processing reuse accepted message "
-                    f"for OOB invitation {invi_msg_id}, {e}"
-                )
-            )
+                "Error processing reuse accepted message "
+                f"for OOB invitation {invi_msg_id}"
+            ) from e
 
     async def receive_problem_report(
         self,
@@ -1098,8 +1251,6 @@ class OutOfBandManager(BaseConnectionManager):
                 await oob_record.save(session)
         except Exception as e:
             raise OutOfBandManagerError(
-                (
-                    "Error processing problem report message "
-                    f"for OOB invitation {invi_msg_id}, {e}"
-                )
-            )
+                "Error processing problem report message "
+                f"for OOB invitation {invi_msg_id}"
+            ) from e
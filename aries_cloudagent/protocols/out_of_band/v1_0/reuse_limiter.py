@@ -0,0 +1,11 @@
+"""Bound on concurrently processed handshake reuse messages."""
+
+import asyncio
+
+
+class ReuseLimiter(asyncio.Semaphore):
+    """Semaphore limiting how many received reuse messages are processed at once.
+
+    Bound in the injection context when the `oob.reuse_concurrency` setting is
+    configured; shared by all out-of-band managers using that context.
+    """
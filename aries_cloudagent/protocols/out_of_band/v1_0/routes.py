@@ -9,10 +9,14 @@ from marshmallow import fields, validate
 from marshmallow.exceptions import ValidationError
 
 from ....admin.request_context import AdminRequestContext
+from ....core.event_bus import Event, EventBus
+from ....core.profile import Profile
+from ....core.util import SHUTDOWN_EVENT_PATTERN
 from ....messaging.models.base import BaseModelError
 from ....messaging.models.openapi import OpenAPISchema
 from ....messaging.valid import UUID4
 from ....storage.error import StorageError, StorageNotFoundError
+from ....utils.webhook_batcher import WebhookBatcher
 
 from ...didcomm_prefix import DIDCommPrefix
 from ...didexchange.v1_0.manager import DIDXManagerError
@@ -60,6 +64,15 @@ class InvitationCreateRequestSchema(OpenAPISchema):
             example="present-proof",
             validate=validate.OneOf(["credential-offer", "present-proof"]),
         )
+        version = fields.Str(
+            description=(
+                "Protocol version of the attached exchange record "
+                "(looked up by trying each version if omitted)"
+            ),
+            example="2.0",
+            required=False,
+            validate=validate.OneOf(["1.0", "2.0"]),
+        )
 
     attachments = fields.Nested(
         AttachmentDefSchema,
@@ -249,6 +262,18 @@ async def invitation_receive(request: web.BaseRequest):
     return web.json_response(result.serialize())
 
 
+def register_events(event_bus: EventBus):
+    """Subscribe to any events we need to support."""
+    event_bus.subscribe(SHUTDOWN_EVENT_PATTERN, on_shutdown_event)
+
+
+async def on_shutdown_event(profile: Profile, event: Event):
+    """Send any pending batched webhooks on shutdown."""
+    batcher = profile.inject_or(WebhookBatcher)
+    if batcher:
+        await batcher.close()
+
+
 async def register(app: web.Application):
     """Register routes."""
     app.add_routes(
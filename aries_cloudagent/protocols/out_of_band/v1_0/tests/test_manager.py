@@ -1,5 +1,6 @@
 """Test OOB Manager."""
 
+import asyncio
 import json
 from copy import deepcopy
 from datetime import datetime, timedelta, timezone
@@ -8,6 +9,8 @@ from unittest.mock import ANY
 
 from asynctest import TestCase as AsyncTestCase, mock as async_mock
 
+from .....cache.base import BaseCache
+from .....cache.in_memory import InMemoryCache
 from .....connections.models.conn_record import ConnRecord
 from .....connections.models.connection_target import ConnectionTarget
 from .....connections.models.diddoc import DIDDoc, PublicKey, PublicKeyType, Service
@@ -63,8 +66,9 @@ from .....protocols.present_proof.v2_0.message_types import (
 from .....protocols.present_proof.v2_0.message_types import PRES_20_REQUEST
 from .....protocols.present_proof.v2_0.messages.pres_format import V20PresFormat
 from .....protocols.present_proof.v2_0.messages.pres_request import V20PresRequest
-from .....storage.error import StorageNotFoundError
+from .....storage.error import StorageError, StorageNotFoundError
 from .....transport.inbound.receipt import MessageReceipt
+from .....utils.webhook_batcher import WebhookBatcher
 from .....wallet.did_info import DIDInfo, KeyInfo
 from .....wallet.did_method import SOV
 from .....wallet.in_memory import InMemoryWallet
@@ -88,6 +92,7 @@ from ..messages.reuse import HandshakeReuse
 from ..messages.reuse_accept import HandshakeReuseAccept
 from ..models.invitation import InvitationRecord
 from ..models.oob_record import OobRecord
+from ..reuse_limiter import ReuseLimiter
 
 
 class TestConfig:
@@ -369,6 +374,21 @@ class TestOOBManager(AsyncTestCase, TestConfig):
             save=async_mock.CoroutineMock(),
         )
 
+    async def test_create_invitation_x_mediation_no_signing_key(self):
+        self.route_manager.mediation_record_if_id = async_mock.CoroutineMock(
+            side_effect=StorageNotFoundError("no mediation record")
+        )
+        with async_mock.patch.object(
+            InMemoryWallet, "create_signing_key", autospec=True
+        ) as mock_create_signing_key:
+            with self.assertRaises(StorageNotFoundError):
+                await self.manager.create_invitation(
+                    my_endpoint=TestConfig.test_endpoint,
+                    hs_protos=[HSProto.RFC23],
+                    mediation_id="no-such-mediation",
+                )
+            mock_create_signing_key.assert_not_called()
+
     async def test_create_invitation_handshake_succeeds(self):
         self.profile.context.update_settings({"public_invites": True})
 
@@ -611,6 +631,51 @@ class TestOOBManager(AsyncTestCase, TestConfig):
                 "~thread": {"pthid": invi_rec.invi_msg_id},
             }
 
+    async def test_create_invitation_attachment_v2_0_cred_offer_versioned(self):
+        with async_mock.patch.object(
+            test_module.V10CredentialExchange,
+            "retrieve_by_id",
+            async_mock.CoroutineMock(),
+        ) as mock_retrieve_cxid_v1, async_mock.patch.object(
+            test_module.V20CredExRecord,
+            "retrieve_by_id",
+            async_mock.CoroutineMock(),
+        ) as mock_retrieve_cxid_v2:
+            mock_retrieve_cxid_v2.return_value = async_mock.MagicMock(
+                cred_offer=async_mock.MagicMock(
+                    serialize=async_mock.MagicMock(return_value={"cred": "offer"})
+                )
+            )
+            invi_rec = await self.manager.create_invitation(
+                my_endpoint=TestConfig.test_endpoint,
+                public=False,
+                hs_protos=None,
+                multi_use=False,
+                attachments=[
+                    {"type": "credential-offer", "id": "dummy-id", "version": "2.0"}
+                ],
+            )
+
+            mock_retrieve_cxid_v1.assert_not_called()
+            mock_retrieve_cxid_v2.assert_called_once_with(ANY, "dummy-id")
+            assert invi_rec.invitation.requests_attach[0].content == {
+                "cred": "offer",
+                "~thread": {"pthid": invi_rec.invi_msg_id},
+            }
+
+    async def test_create_invitation_attachment_x_version(self):
+        with self.assertRaises(OutOfBandManagerError) as context:
+            await self.manager.create_invitation(
+                my_endpoint=TestConfig.test_endpoint,
+                public=False,
+                hs_protos=None,
+                multi_use=False,
+                attachments=[
+                    {"type": "present-proof", "id": "dummy-id", "version": "3.0"}
+                ],
+            )
+        assert "Unknown attachment version" in str(context.exception)
+
     async def test_create_invitation_attachment_present_proof_v1_0(self):
         self.profile.context.update_settings({"public_invites": True})
         with async_mock.patch.object(
@@ -922,6 +987,112 @@ class TestOOBManager(AsyncTestCase, TestConfig):
                 context.exception
             )
 
+    async def test_create_handshake_reuse_msg_x_send_deletes_record(self):
+        self.profile.context.update_settings({"public_invites": True})
+        self.responder.send = async_mock.CoroutineMock(
+            side_effect=Exception("send failed")
+        )
+        with async_mock.patch.object(
+            OutOfBandManager,
+            "fetch_connection_targets",
+            autospec=True,
+        ) as oob_mgr_fetch_conn:
+            oob_mgr_fetch_conn.return_value = ConnectionTarget(
+                did=TestConfig.test_did,
+                endpoint=TestConfig.test_endpoint,
+                recipient_keys=[TestConfig.test_verkey],
+                sender_key=TestConfig.test_verkey,
+            )
+
+            invitation = InvitationMessage()
+            oob_record = OobRecord(
+                invitation=invitation,
+                invi_msg_id=invitation._id,
+                role=OobRecord.ROLE_RECEIVER,
+                connection_id=self.test_conn_rec.connection_id,
+                state=OobRecord.STATE_INITIAL,
+            )
+
+            with self.assertRaises(OutOfBandManagerError):
+                await self.manager._create_handshake_reuse_message(
+                    oob_record, self.test_conn_rec, get_version_from_message(invitation)
+                )
+
+        async with self.profile.session() as session:
+            with self.assertRaises(StorageNotFoundError):
+                await OobRecord.retrieve_by_id(session, oob_record.oob_id)
+
+    async def test_create_handshake_reuse_msg_x_save_no_delete(self):
+        self.profile.context.update_settings({"public_invites": True})
+        with async_mock.patch.object(
+            OutOfBandManager,
+            "fetch_connection_targets",
+            autospec=True,
+        ) as oob_mgr_fetch_conn, async_mock.patch.object(
+            OobRecord,
+            "save",
+            async_mock.CoroutineMock(side_effect=StorageError("save failed")),
+        ), async_mock.patch.object(
+            OobRecord, "delete_record", async_mock.CoroutineMock()
+        ) as mock_delete:
+            oob_mgr_fetch_conn.return_value = ConnectionTarget(
+                did=TestConfig.test_did,
+                endpoint=TestConfig.test_endpoint,
+                recipient_keys=[TestConfig.test_verkey],
+                sender_key=TestConfig.test_verkey,
+            )
+
+            invitation = InvitationMessage()
+            oob_record = OobRecord(
+                invitation=invitation,
+                invi_msg_id=invitation._id,
+                role=OobRecord.ROLE_RECEIVER,
+                connection_id=self.test_conn_rec.connection_id,
+                state=OobRecord.STATE_INITIAL,
+            )
+
+            with self.assertRaises(OutOfBandManagerError):
+                await self.manager._create_handshake_reuse_message(
+                    oob_record, self.test_conn_rec, get_version_from_message(invitation)
+                )
+
+            mock_delete.assert_not_called()
+            self.responder.send.assert_not_called()
+
+    async def test_create_handshake_reuse_msg_x_save_cancelled(self):
+        self.profile.context.update_settings({"public_invites": True})
+        with async_mock.patch.object(
+            OutOfBandManager,
+            "fetch_connection_targets",
+            autospec=True,
+        ) as oob_mgr_fetch_conn, async_mock.patch.object(
+            OobRecord,
+            "save",
+            async_mock.CoroutineMock(side_effect=asyncio.CancelledError()),
+        ):
+            oob_mgr_fetch_conn.return_value = ConnectionTarget(
+                did=TestConfig.test_did,
+                endpoint=TestConfig.test_endpoint,
+                recipient_keys=[TestConfig.test_verkey],
+                sender_key=TestConfig.test_verkey,
+            )
+
+            invitation = InvitationMessage()
+            oob_record = OobRecord(
+                invitation=invitation,
+                invi_msg_id=invitation._id,
+                role=OobRecord.ROLE_RECEIVER,
+                connection_id=self.test_conn_rec.connection_id,
+                state=OobRecord.STATE_INITIAL,
+            )
+
+            with self.assertRaises(asyncio.CancelledError):
+                await self.manager._create_handshake_reuse_message(
+                    oob_record, self.test_conn_rec, get_version_from_message(invitation)
+                )
+
+            self.responder.send.assert_not_called()
+
     async def test_receive_reuse_message_existing_found(self):
         self.profile.context.update_settings({"public_invites": True})
 
@@ -1107,6 +1278,196 @@ class TestOOBManager(AsyncTestCase, TestConfig):
                 },
             )
 
+    async def test_receive_reuse_message_batched_webhook(self):
+        self.profile.context.injector.bind_instance(
+            WebhookBatcher, WebhookBatcher(max_size=2, max_wait=10.0)
+        )
+        receipt = MessageReceipt(
+            recipient_did=TestConfig.test_did,
+            recipient_did_public=False,
+        )
+        self.test_conn_rec.state = ConnRecord.State.COMPLETED.rfc160
+
+        with async_mock.patch.object(
+            OutOfBandManager, "fetch_connection_targets", autospec=True
+        ), async_mock.patch.object(
+            OobRecord, "retrieve_by_tag_filter", autospec=True
+        ) as mock_retrieve_oob, async_mock.patch.object(
+            self.profile, "notify", autospec=True
+        ) as mock_notify:
+            mock_retrieve_oob.return_value = async_mock.MagicMock(
+                emit_event=async_mock.CoroutineMock(),
+                delete_record=async_mock.CoroutineMock(),
+                connection_id=None,
+                multi_use=True,
+            )
+
+            payloads = []
+            for thid in ("thread-1", "thread-2"):
+                reuse_msg = HandshakeReuse()
+                reuse_msg.assign_thread_id(thid=thid, pthid="the-pthid")
+                await self.manager.receive_reuse_message(
+                    reuse_msg, receipt, self.test_conn_rec
+                )
+                payloads.append(
+                    {
+                        "thread_id": thid,
+                        "connection_id": self.test_conn_rec.connection_id,
+                        "comment": "Connection dummy is being reused for invitation the-pthid",
+                    }
+                )
+
+            mock_notify.assert_called_once_with(
+                REUSE_WEBHOOK_TOPIC, {"events": payloads}
+            )
+            assert self.responder.send.call_count == 2
+
+    async def test_receive_reuse_accepted_batched_webhook(self):
+        self.profile.context.injector.bind_instance(
+            WebhookBatcher, WebhookBatcher(max_size=1, max_wait=10.0)
+        )
+        receipt = MessageReceipt(
+            recipient_did=TestConfig.test_did,
+            recipient_did_public=False,
+            sender_did="test_did",
+        )
+        reuse_msg_accepted = HandshakeReuseAccept()
+        reuse_msg_accepted.assign_thread_id(thid="the-thread-id", pthid="the-pthid")
+
+        with async_mock.patch.object(
+            self.profile, "notify", autospec=True
+        ) as mock_notify, async_mock.patch.object(
+            OobRecord, "retrieve_by_tag_filter", autospec=True
+        ) as mock_retrieve_oob:
+            mock_retrieve_oob.return_value = async_mock.MagicMock(
+                emit_event=async_mock.CoroutineMock(),
+                delete_record=async_mock.CoroutineMock(),
+            )
+
+            await self.manager.receive_reuse_accepted_message(
+                reuse_msg_accepted, receipt, self.test_conn_rec
+            )
+
+            mock_notify.assert_called_once_with(
+                REUSE_ACCEPTED_WEBHOOK_TOPIC,
+                {
+                    "invi_msg_id": "the-pthid",
+                    "accepts": [
+                        {
+                            "thread_id": "the-thread-id",
+                            "connection_id": self.test_conn_rec.connection_id,
+                            "state": "accepted",
+                            "comment": f"Connection {self.test_conn_rec.connection_id} is being reused for invitation the-pthid",
+                        }
+                    ],
+                },
+            )
+
+    async def test_receive_reuse_accepted_batched_per_invitation(self):
+        self.profile.context.injector.bind_instance(
+            WebhookBatcher, WebhookBatcher(max_size=2, max_wait=0.01)
+        )
+        receipt = MessageReceipt(
+            recipient_did=TestConfig.test_did,
+            recipient_did_public=False,
+            sender_did="test_did",
+        )
+
+        def accepted(thid, pthid):
+            return {
+                "thread_id": thid,
+                "connection_id": self.test_conn_rec.connection_id,
+                "state": "accepted",
+                "comment": f"Connection {self.test_conn_rec.connection_id} is being reused for invitation {pthid}",
+            }
+
+        with async_mock.patch.object(
+            self.profile, "notify", autospec=True
+        ) as mock_notify, async_mock.patch.object(
+            OobRecord, "retrieve_by_tag_filter", autospec=True
+        ) as mock_retrieve_oob:
+            mock_retrieve_oob.return_value = async_mock.MagicMock(
+                emit_event=async_mock.CoroutineMock(),
+                delete_record=async_mock.CoroutineMock(),
+            )
+
+            for thid, pthid in (
+                ("thread-1", "invi-a"),
+                ("thread-2", "invi-b"),
+                ("thread-3", "invi-a"),
+            ):
+                reuse_msg_accepted = HandshakeReuseAccept()
+                reuse_msg_accepted.assign_thread_id(thid=thid, pthid=pthid)
+                await self.manager.receive_reuse_accepted_message(
+                    reuse_msg_accepted, receipt, self.test_conn_rec
+                )
+
+            # the full batch for invi-a is sent at once
+            mock_notify.assert_called_once_with(
+                REUSE_ACCEPTED_WEBHOOK_TOPIC,
+                {
+                    "invi_msg_id": "invi-a",
+                    "accepts": [
+                        accepted("thread-1", "invi-a"),
+                        accepted("thread-3", "invi-a"),
+                    ],
+                },
+            )
+
+            # the batch for invi-b is sent once it has waited long enough
+            await asyncio.sleep(0.05)
+            assert mock_notify.call_count == 2
+            mock_notify.assert_called_with(
+                REUSE_ACCEPTED_WEBHOOK_TOPIC,
+                {"invi_msg_id": "invi-b", "accepts": [accepted("thread-2", "invi-b")]},
+            )
+
+    async def test_receive_reuse_message_batched_webhook_held(self):
+        self.profile.context.injector.bind_instance(
+            WebhookBatcher, WebhookBatcher(max_size=2, max_wait=0.01)
+        )
+        receipt = MessageReceipt(
+            recipient_did=TestConfig.test_did,
+            recipient_did_public=False,
+        )
+        reuse_msg = HandshakeReuse()
+        reuse_msg.assign_thread_id(thid="the-thread-id", pthid="the-pthid")
+        self.test_conn_rec.state = ConnRecord.State.COMPLETED.rfc160
+
+        with async_mock.patch.object(
+            OutOfBandManager, "fetch_connection_targets", autospec=True
+        ), async_mock.patch.object(
+            OobRecord, "retrieve_by_tag_filter", autospec=True
+        ) as mock_retrieve_oob, async_mock.patch.object(
+            self.profile, "notify", autospec=True
+        ) as mock_notify:
+            mock_retrieve_oob.return_value = async_mock.MagicMock(
+                emit_event=async_mock.CoroutineMock(),
+                delete_record=async_mock.CoroutineMock(),
+                connection_id=None,
+                multi_use=True,
+            )
+
+            await self.manager.receive_reuse_message(
+                reuse_msg, receipt, self.test_conn_rec
+            )
+            mock_notify.assert_not_called()
+            self.responder.send.assert_called_once()
+
+            await asyncio.sleep(0.05)
+            mock_notify.assert_called_once_with(
+                REUSE_WEBHOOK_TOPIC,
+                {
+                    "events": [
+                        {
+                            "thread_id": "the-thread-id",
+                            "connection_id": self.test_conn_rec.connection_id,
+                            "comment": "Connection dummy is being reused for invitation the-pthid",
+                        }
+                    ]
+                },
+            )
+
     async def test_receive_problem_report(self):
         self.profile.context.update_settings({"public_invites": True})
 
@@ -1271,6 +1632,69 @@ class TestOOBManager(AsyncTestCase, TestConfig):
 
             await self.manager.receive_invitation(oob_invitation)
 
+    async def test_receive_invitation_handshake_stores_oob_record(self):
+        mock_conn = async_mock.MagicMock(connection_id="dummy-connection")
+
+        with async_mock.patch.object(
+            test_module, "DIDXManager", autospec=True
+        ) as didx_mgr_cls, async_mock.patch.object(
+            self.profile, "notify", autospec=True
+        ) as mock_notify:
+            didx_mgr_cls.return_value = async_mock.MagicMock(
+                receive_invitation=async_mock.CoroutineMock(return_value=mock_conn)
+            )
+            oob_invitation = InvitationMessage(
+                handshake_protocols=[DIDCommPrefix.qualify_current(HSProto.RFC23.name)],
+                services=[
+                    OobService(
+                        recipient_keys=["dummy"],
+                        routing_keys=[],
+                    )
+                ],
+            )
+
+            oob_record = await self.manager.receive_invitation(oob_invitation)
+
+        assert oob_record.oob_id
+        assert oob_record.connection_id == "dummy-connection"
+        topics = [call[0][0] for call in mock_notify.call_args_list]
+        assert topics == [
+            "acapy::record::out_of_band::initial",
+            "acapy::record::out_of_band::done",
+            "acapy::record::out_of_band::deleted",
+        ]
+
+    async def test_receive_invitation_handshake_receiver_dispatch(self):
+        mock_conn = async_mock.MagicMock(connection_id="dummy-connection")
+
+        with async_mock.patch.object(
+            self.manager,
+            "_receive_didexchange_invitation",
+            async_mock.CoroutineMock(),
+        ) as mock_receive_didx, async_mock.patch.object(
+            self.manager,
+            "_receive_connection_invitation",
+            async_mock.CoroutineMock(return_value=mock_conn),
+        ) as mock_receive_conn:
+            oob_invitation = InvitationMessage(
+                handshake_protocols=[
+                    DIDCommPrefix.qualify_current(HSProto.RFC160.name),
+                    DIDCommPrefix.qualify_current(HSProto.RFC23.name),
+                ],
+                services=[
+                    OobService(
+                        recipient_keys=["dummy"],
+                        routing_keys=[],
+                    )
+                ],
+            )
+
+            oob_record = await self.manager.receive_invitation(oob_invitation)
+
+            mock_receive_conn.assert_called_once()
+            mock_receive_didx.assert_not_called()
+            assert oob_record.connection_id == "dummy-connection"
+
     async def test_receive_invitation_connection_protocol(self):
         self.profile.context.update_settings({"public_invites": True})
 
@@ -1472,10 +1896,6 @@ class TestOOBManager(AsyncTestCase, TestConfig):
             ConnRecord,
             "find_existing_connection",
             async_mock.CoroutineMock(return_value=test_exist_conn),
-        ), async_mock.patch.object(
-            ConnRecord,
-            "retrieve_by_id",
-            async_mock.CoroutineMock(return_value=test_exist_conn),
         ):
             oob_invitation = InvitationMessage(
                 handshake_protocols=[
@@ -1489,7 +1909,7 @@ class TestOOBManager(AsyncTestCase, TestConfig):
                 delete_record=async_mock.CoroutineMock(),
                 emit_event=async_mock.CoroutineMock(),
             )
-            perform_handshake.return_value = mock_oob
+            perform_handshake.return_value = (mock_oob, test_exist_conn)
 
             handle_handshake_reuse.return_value = async_mock.MagicMock(
                 state=OobRecord.STATE_NOT_ACCEPTED
@@ -1740,3 +2160,163 @@ class TestOOBManager(AsyncTestCase, TestConfig):
             mock_connrecord_query.return_value = records
             await self.manager.delete_stale_connection_by_invitation("test123")
             mock_connrecord_delete.assert_called_once()
+
+    async def test_delete_stale_connection_by_invitation_in_session(self):
+        with async_mock.patch.object(
+            ConnRecord, "query", async_mock.CoroutineMock()
+        ) as mock_connrecord_query, async_mock.patch.object(
+            ConnRecord, "delete_record", async_mock.CoroutineMock()
+        ) as mock_connrecord_delete:
+            mock_connrecord_query.return_value = [
+                ConnRecord(invitation_mode="once", invitation_msg_id="test123")
+            ]
+            async with self.profile.session() as session:
+                await self.manager.delete_stale_connection_by_invitation(
+                    "test123", session
+                )
+            assert mock_connrecord_query.call_args[0][0] is session
+            mock_connrecord_delete.assert_called_once_with(session)
+
+    async def test_get_connection_targets_cached(self):
+        self.profile.context.injector.bind_instance(BaseCache, InMemoryCache())
+        target = ConnectionTarget(
+            did=TestConfig.test_did,
+            endpoint=TestConfig.test_endpoint,
+            recipient_keys=[TestConfig.test_verkey],
+            sender_key=TestConfig.test_verkey,
+        )
+        with async_mock.patch.object(
+            OutOfBandManager,
+            "fetch_connection_targets",
+            async_mock.CoroutineMock(return_value=[target]),
+        ) as oob_mgr_fetch_conn:
+            first = await self.manager.get_connection_targets(
+                connection=self.test_conn_rec
+            )
+            second = await self.manager.get_connection_targets(
+                connection=self.test_conn_rec
+            )
+
+        oob_mgr_fetch_conn.assert_called_once()
+        assert first == [target]
+        assert [row.serialize() for row in second] == [target.serialize()]
+
+    async def test_receive_reuse_message_same_invitation_no_conn_save(self):
+        receipt = MessageReceipt(
+            recipient_did=TestConfig.test_did,
+            recipient_did_public=False,
+        )
+
+        reuse_msg = HandshakeReuse()
+        reuse_msg.assign_thread_id(thid="the-thread-id", pthid="the-pthid")
+
+        self.test_conn_rec.invitation_msg_id = "the-pthid"
+        self.test_conn_rec.state = ConnRecord.State.COMPLETED.rfc160
+
+        with async_mock.patch.object(
+            OutOfBandManager, "fetch_connection_targets", autospec=True
+        ), async_mock.patch.object(
+            OobRecord, "retrieve_by_tag_filter", autospec=True
+        ) as mock_retrieve_oob, async_mock.patch.object(
+            ConnRecord, "save", autospec=True
+        ) as mock_conn_save:
+            mock_retrieve_oob.return_value = async_mock.MagicMock(
+                emit_event=async_mock.CoroutineMock(),
+                delete_record=async_mock.CoroutineMock(),
+                multi_use=True,
+            )
+
+            await self.manager.receive_reuse_message(
+                reuse_msg, receipt, self.test_conn_rec
+            )
+            mock_conn_save.assert_not_called()
+            self.responder.send.assert_called_once()
+
+    async def test_receive_reuse_message_no_stale_conn_query(self):
+        receipt = MessageReceipt(
+            recipient_did=TestConfig.test_did,
+            recipient_did_public=False,
+        )
+
+        reuse_msg = HandshakeReuse()
+        reuse_msg.assign_thread_id(thid="the-thread-id", pthid="the-pthid")
+
+        self.test_conn_rec.state = ConnRecord.State.COMPLETED.rfc160
+
+        with async_mock.patch.object(
+            OutOfBandManager, "fetch_connection_targets", autospec=True
+        ), async_mock.patch.object(
+            OobRecord, "retrieve_by_tag_filter", autospec=True
+        ) as mock_retrieve_oob, async_mock.patch.object(
+            ConnRecord, "query", async_mock.CoroutineMock()
+        ) as mock_connrecord_query:
+            mock_retrieve_oob.return_value = async_mock.MagicMock(
+                emit_event=async_mock.CoroutineMock(),
+                delete_record=async_mock.CoroutineMock(),
+                connection_id=None,
+                multi_use=False,
+            )
+
+            await self.manager.receive_reuse_message(
+                reuse_msg, receipt, self.test_conn_rec
+            )
+            mock_connrecord_query.assert_not_called()
+            self.responder.send.assert_called_once()
+
+    async def test_delete_stale_connection_by_invitation_connection_id(self):
+        stale = ConnRecord(
+            connection_id="stale-id",
+            state=ConnRecord.State.INVITATION.rfc160,
+            invitation_mode="once",
+            invitation_msg_id="test123",
+        )
+        with async_mock.patch.object(
+            ConnRecord, "query", async_mock.CoroutineMock()
+        ) as mock_connrecord_query, async_mock.patch.object(
+            ConnRecord, "retrieve_by_id", async_mock.CoroutineMock(return_value=stale)
+        ) as mock_connrecord_retrieve, async_mock.patch.object(
+            ConnRecord, "delete_record", async_mock.CoroutineMock()
+        ) as mock_connrecord_delete:
+            await self.manager.delete_stale_connection_by_invitation(
+                "test123", connection_id="stale-id"
+            )
+            mock_connrecord_query.assert_not_called()
+            mock_connrecord_retrieve.assert_called_once_with(ANY, "stale-id")
+            mock_connrecord_delete.assert_called_once()
+
+            # a connection that progressed past the invitation is kept
+            mock_connrecord_delete.reset_mock()
+            stale.state = ConnRecord.State.COMPLETED.rfc160
+            await self.manager.delete_stale_connection_by_invitation(
+                "test123", connection_id="stale-id"
+            )
+            mock_connrecord_delete.assert_not_called()
+
+    async def test_receive_reuse_message_concurrency_limit(self):
+        self.profile.context.injector.bind_instance(ReuseLimiter, ReuseLimiter(1))
+        reuse_msg = HandshakeReuse()
+        reuse_msg.assign_thread_id(thid="the-thread-id", pthid="the-pthid")
+
+        active = []
+        max_active = []
+
+        async def receive(*args):
+            active.append(1)
+            max_active.append(len(active))
+            await asyncio.sleep(0.01)
+            active.pop()
+
+        with async_mock.patch.object(
+            OutOfBandManager, "_receive_reuse_message", side_effect=receive
+        ) as mock_receive:
+            await asyncio.gather(
+                *(
+                    self.manager.receive_reuse_message(
+                        reuse_msg, async_mock.MagicMock(), self.test_conn_rec
+                    )
+                    for _ in range(3)
+                )
+            )
+
+        assert mock_receive.call_count == 3
+        assert max(max_active) == 1
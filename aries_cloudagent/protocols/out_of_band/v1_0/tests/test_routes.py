@@ -3,6 +3,10 @@ from asynctest import mock as async_mock
 
 from .....admin.request_context import AdminRequestContext
 from .....connections.models.conn_record import ConnRecord
+from .....core.event_bus import Event, MockEventBus
+from .....core.in_memory import InMemoryProfile
+from .....core.util import SHUTDOWN_EVENT_TOPIC
+from .....utils.webhook_batcher import WebhookBatcher
 
 from .. import routes as test_module
 
@@ -175,6 +179,31 @@ class TestOutOfBandRoutes(AsyncTestCase):
         await test_module.register(mock_app)
         mock_app.add_routes.assert_called_once()
 
+    async def test_register_events(self):
+        event_bus = MockEventBus()
+        test_module.register_events(event_bus)
+        assert event_bus.topic_patterns_to_subscribers
+
+    async def test_on_shutdown_event(self):
+        profile = InMemoryProfile.test_profile()
+        batcher = WebhookBatcher(max_size=10, max_wait=10.0)
+        profile.context.injector.bind_instance(WebhookBatcher, batcher)
+
+        with async_mock.patch.object(
+            profile, "notify", async_mock.CoroutineMock()
+        ) as mock_notify:
+            await batcher.enqueue(profile, "topic", {"n": 1})
+            mock_notify.assert_not_called()
+
+            await test_module.on_shutdown_event(
+                profile, Event(SHUTDOWN_EVENT_TOPIC, {})
+            )
+            mock_notify.assert_called_once_with("topic", {"events": [{"n": 1}]})
+
+            # payloads from handlers still running are sent right away
+            await batcher.enqueue(profile, "topic", {"n": 2})
+            mock_notify.assert_called_with("topic", {"events": [{"n": 2}]})
+
     async def test_post_process_routes(self):
         mock_app = async_mock.MagicMock(_state={"swagger_dict": {}})
         test_module.post_process_routes(mock_app)
@@ -0,0 +1,71 @@
+import asyncio
+
+from asynctest import mock, TestCase
+
+from .. import webhook_batcher as test_module
+
+
+class TestWebhookBatcher(TestCase):
+    async def test_flush_on_max_size(self):
+        profile = mock.MagicMock(notify=mock.CoroutineMock())
+        batcher = test_module.WebhookBatcher(max_size=2, max_wait=10.0)
+
+        await batcher.enqueue(profile, "topic", {"n": 1})
+        profile.notify.assert_not_called()
+        await batcher.enqueue(profile, "topic", {"n": 2})
+        profile.notify.assert_called_once_with(
+            "topic", {"events": [{"n": 1}, {"n": 2}]}
+        )
+        assert not batcher._timers
+
+    async def test_flush_on_max_wait(self):
+        profile = mock.MagicMock(notify=mock.CoroutineMock())
+        batcher = test_module.WebhookBatcher(max_size=10, max_wait=0.01)
+
+        await batcher.enqueue(profile, "topic", {"n": 1})
+        await asyncio.sleep(0.05)
+        profile.notify.assert_called_once_with("topic", {"events": [{"n": 1}]})
+        assert not batcher._buffers
+
+    async def test_close(self):
+        profile = mock.MagicMock(notify=mock.CoroutineMock())
+        batcher = test_module.WebhookBatcher(max_size=10, max_wait=10.0)
+
+        await batcher.enqueue(profile, "one", {"n": 1})
+        await batcher.enqueue(profile, "two", {"n": 2})
+        await batcher.close()
+        assert profile.notify.call_count == 2
+        assert not batcher._buffers and not batcher._timers
+
+        await batcher.enqueue(
+            profile, "three", {"n": 3}, group={"invi_msg_id": "a"}, field="accepts"
+        )
+        profile.notify.assert_called_with(
+            "three", {"invi_msg_id": "a", "accepts": [{"n": 3}]}
+        )
+        assert not batcher._buffers and not batcher._timers
+
+    async def test_grouped(self):
+        profile = mock.MagicMock(notify=mock.CoroutineMock())
+        batcher = test_module.WebhookBatcher(max_size=2, max_wait=10.0)
+
+        await batcher.enqueue(
+            profile, "topic", {"n": 1}, group={"invi_msg_id": "a"}, field="accepts"
+        )
+        await batcher.enqueue(
+            profile, "topic", {"n": 2}, group={"invi_msg_id": "b"}, field="accepts"
+        )
+        profile.notify.assert_not_called()
+
+        await batcher.enqueue(
+            profile, "topic", {"n": 3}, group={"invi_msg_id": "a"}, field="accepts"
+        )
+        profile.notify.assert_called_once_with(
+            "topic", {"invi_msg_id": "a", "accepts": [{"n": 1}, {"n": 3}]}
+        )
+
+        await batcher.close()
+        profile.notify.assert_called_with(
+            "topic", {"invi_msg_id": "b", "accepts": [{"n": 2}]}
+        )
+        assert not batcher._buffers and not batcher._timers
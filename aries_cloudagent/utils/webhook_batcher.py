@@ -0,0 +1,95 @@
+"""Coalesce bursts of webhook events into batched notifications."""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Tuple
+
+if TYPE_CHECKING:  # To avoid circular import error
+    from ..core.profile import Profile
+
+LOGGER = logging.getLogger(__name__)
+
+# Batch key: profile, topic, sorted group items, name of the payload list field
+BatchKey = Tuple["Profile", str, Tuple[Tuple[str, Any], ...], str]
+
+
+class WebhookBatcher:
+    """Buffer webhook payloads per profile and topic and notify them in batches.
+
+    A batch is emitted on the original topic as ``{"events": [payload, ...]}``
+    once it holds `max_size` payloads or `max_wait` seconds after its first
+    payload was added, whichever comes first.
+
+    Payloads enqueued with a `group` are batched per group value instead, and
+    the group items are included in the batch payload, e.g.
+    ``{"invi_msg_id": ..., "accepts": [payload, ...]}``.
+
+    Once closed, payloads are no longer held but sent right away, each in a
+    batch of its own.
+    """
+
+    def __init__(self, max_size: int = 50, max_wait: float = 2.0):
+        """
+        Initialize a WebhookBatcher.
+
+        Args:
+            max_size: number of payloads after which a batch is sent immediately
+            max_wait: maximum time in seconds a payload is held before sending
+        """
+        self.max_size = max_size
+        self.max_wait = max_wait
+        self._buffers: Dict[BatchKey, List[Any]] = {}
+        self._timers: Dict[BatchKey, asyncio.Task] = {}
+        self._closed = False
+
+    async def enqueue(
+        self,
+        profile: "Profile",
+        topic: str,
+        payload: Any,
+        *,
+        group: Mapping[str, Any] = None,
+        field: str = "events",
+    ):
+        """Add a webhook payload to the batch for its profile, topic and group.
+
+        Args:
+            profile: the profile to notify the batch on
+            topic: the webhook event topic
+            payload: the webhook payload to batch
+            group: optional items identifying the batch, added to its payload
+            field: the name of the batch payload field listing the payloads
+        """
+        key = (profile, topic, tuple(sorted((group or {}).items())), field)
+        if self._closed:
+            await profile.notify(topic, {**dict(key[2]), field: [payload]})
+            return
+        buffer = self._buffers.setdefault(key, [])
+        buffer.append(payload)
+        if len(buffer) >= self.max_size:
+            await self._flush_key(key)
+        elif key not in self._timers:
+            self._timers[key] = asyncio.ensure_future(self._flush_later(key))
+
+    async def _flush_later(self, key: BatchKey):
+        await asyncio.sleep(self.max_wait)
+        self._timers.pop(key, None)
+        try:
+            await self._flush_key(key)
+        except Exception:
+            LOGGER.exception("Error sending batched webhook for topic %s", key[1])
+
+    async def _flush_key(self, key: BatchKey):
+        timer = self._timers.pop(key, None)
+        if timer and timer is not asyncio.current_task():
+            timer.cancel()
+        events = self._buffers.pop(key, None)
+        if events:
+            profile, topic, group, field = key
+            await profile.notify(topic, {**dict(group), field: events})
+
+    async def close(self):
+        """Send all pending batches and stop holding later payloads."""
+        self._closed = True
+        for key in list(self._buffers):
+            await self._flush_key(key)